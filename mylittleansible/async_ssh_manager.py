@@ -0,0 +1,128 @@
+"""Async SSH connection manager for MyLittleAnsible (asyncssh backend)."""
+
+import logging
+from typing import Optional
+
+from mylittleansible.utils import (
+    CmdResult,
+    get_all_ssh_key_paths,
+    get_current_user,
+    resolve_key_for,
+)
+
+try:
+    import asyncssh
+except ImportError:
+    # asyncssh is a regular dependency; this guard only keeps paramiko
+    # runs working in environments installed before it was added.
+    asyncssh = None
+
+logger = logging.getLogger("ssh")
+
+
+class AsyncSSHManager:
+    """
+    asyncssh counterpart of SSHManager: one authenticated connection per
+    host, with cheap channels multiplexed over it for each command. All
+    hosts can handshake and execute concurrently on a single event loop.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int = 22,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        key_file: Optional[str] = None,
+        timeout: int = 10,
+    ) -> None:
+        if asyncssh is None:
+            raise ImportError(
+                "The asyncssh backend requires the 'asyncssh' package "
+                "(pip install asyncssh)"
+            )
+
+        self.hostname = hostname
+        self.port = port
+        self.username = username or get_current_user()
+        self.password = password
+        self.key_file = key_file
+        self.timeout = timeout
+        self.conn = None
+
+    async def connect(self):
+        """
+        Establish an SSH connection and return the connection object.
+        """
+        if self.conn is not None:
+            return self.conn
+
+        logger.info(
+            "Connecting to %s:%s as %s (asyncssh)",
+            self.hostname,
+            self.port,
+            self.username,
+        )
+
+        connect_kwargs = {
+            "host": self.hostname,
+            "port": self.port,
+            "known_hosts": None,
+            "connect_timeout": self.timeout,
+        }
+
+        if self.username:
+            connect_kwargs["username"] = self.username
+
+        if self.password:
+            connect_kwargs["password"] = self.password
+
+        if self.key_file:
+            # Cached per (user, host): parallel tasks on the same host
+            # resolve (and ~-expand) the key once.
+            key_path = (
+                resolve_key_for(self.username, self.hostname, self.key_file)
+                or self.key_file
+            )
+            connect_kwargs["client_keys"] = [key_path]
+        else:
+            # Offer every default key at once so asyncssh can try them
+            # within one handshake rather than one connection attempt
+            # per key.
+            default_keys = get_all_ssh_key_paths()
+            if default_keys:
+                connect_kwargs["client_keys"] = default_keys
+
+        self.conn = await asyncssh.connect(**connect_kwargs)
+        logger.info("Successfully connected to %s:%s", self.hostname, self.port)
+        return self.conn
+
+    async def run_command(self, command: str) -> CmdResult:
+        """
+        Execute a command over a new channel on the shared connection.
+        """
+        conn = await self.connect()
+
+        logger.debug("Executing command on %s: %s", self.hostname, command)
+        result = await conn.run(command, check=False)
+
+        # returncode is the exit status, or negative the signal number
+        # when the remote process was killed; exit_status alone is None
+        # in that case and must not be mistaken for success.
+        exit_code = result.returncode
+        if exit_code is None:
+            exit_code = 1
+
+        return CmdResult(
+            stdout=result.stdout or "",
+            stderr=result.stderr or "",
+            exit_code=exit_code,
+        )
+
+    async def close(self) -> None:
+        """Close the SSH connection."""
+        if self.conn is not None:
+            logger.info("Closing SSH connection to %s:%s", self.hostname, self.port)
+            self.conn.close()
+            await self.conn.wait_closed()
+            self.conn = None
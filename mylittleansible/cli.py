@@ -32,6 +32,22 @@ logger = get_logger("mla")
     is_flag=True,
     help="Simulate execution without making changes",
 )
+@click.option(
+    "--backend",
+    type=click.Choice(["paramiko", "asyncssh"]),
+    default="paramiko",
+    show_default=True,
+    help=(
+        "SSH backend to use (asyncssh supports only the shell-based "
+        "modules: command, service, sysctl)"
+    ),
+)
+@click.option(
+    "--forks",
+    default=16,
+    show_default=True,
+    help="Maximum number of hosts to execute on in parallel",
+)
 @click.option(
     "-v",
     "--verbose",
@@ -43,7 +59,15 @@ logger = get_logger("mla")
     is_flag=True,
     help="Enable debug mode (show full stack traces on errors)",
 )
-def main(playbook_file: str, inventory_file: str, dry_run: bool, verbose: int, debug: bool) -> None:
+def main(
+    playbook_file: str,
+    inventory_file: str,
+    dry_run: bool,
+    backend: str,
+    forks: int,
+    verbose: int,
+    debug: bool,
+) -> None:
 
     """
     Entry point for the MyLittleAnsible CLI.
@@ -70,12 +94,15 @@ def main(playbook_file: str, inventory_file: str, dry_run: bool, verbose: int, d
         inventory = Inventory.load(inventory_file)
         logger.info("Loaded inventory with %d host(s)", len(inventory.hosts))
 
-        playbook = Playbook.load(playbook_file, dry_run=dry_run)
+        playbook = Playbook.load(playbook_file, dry_run=dry_run, forks=forks)
         logger.info("Loaded playbook with %d task(s)", len(playbook.tasks))
 
         logger.info("Executing playbook...")
 
-        result = playbook.execute(inventory)
+        if backend == "asyncssh":
+            result = playbook.execute_async(inventory)
+        else:
+            result = playbook.execute(inventory)
 
         # Exit with appropriate code
         if not result.is_success:
@@ -85,7 +112,7 @@ def main(playbook_file: str, inventory_file: str, dry_run: bool, verbose: int, d
         logger.info("Playbook execution completed successfully")
 
     except FileNotFoundError as e:
-        logger.error("File not found: %s", str(e))
+        logger.error("File not found: %s", e)
         raise Exit(code=1) from e
 
     except Exception as e:
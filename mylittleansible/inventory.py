@@ -1,9 +1,21 @@
 """Inventory management for MyLittleAnsible."""
 
-from dataclasses import dataclass
-from typing import Dict, Any
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
-import yaml
+from mylittleansible.yaml_cache import load_cached
+
+
+@dataclass(slots=True)
+class Host:
+    """Connection settings for one inventory host, parsed once at load."""
+
+    name: str
+    address: Optional[str] = None
+    port: int = 22
+    user: Optional[str] = None
+    password: Optional[str] = None
+    key_file: Optional[str] = None
 
 
 @dataclass
@@ -12,6 +24,25 @@ class Inventory:
 
     inventory_file: str
     hosts: Dict[str, Any]
+    host_list: List[Host] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        # Preparse the raw dicts into Host objects so the execution loop
+        # reads plain attributes instead of repeating dict lookups with
+        # defaults on every task.
+        if not self.host_list:
+            self.host_list = [
+                Host(
+                    name=name,
+                    address=config.get("ssh_address"),
+                    port=config.get("ssh_port", 22),
+                    user=config.get("ssh_user"),
+                    password=config.get("ssh_password"),
+                    key_file=config.get("ssh_key_file"),
+                )
+                for name, config in self.hosts.items()
+                if isinstance(config, dict)
+            ]
 
     @classmethod
     def load(cls, inventory_file: str) -> "Inventory":
@@ -23,8 +54,7 @@ class Inventory:
         Returns:
             Inventory instance with loaded hosts.
         """
-        with open(inventory_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = load_cached(inventory_file)
 
         hosts = data.get("hosts", {}) if data else {}
 
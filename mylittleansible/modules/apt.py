@@ -1,16 +1,21 @@
 """APT Module for MyLittleAnsible"""
 
+import shlex
+from typing import TYPE_CHECKING
+
 from mylittleansible.modules.base import BaseModule
 from mylittleansible.utils import CmdResult
-from paramiko import SSHClient
+
+if TYPE_CHECKING:
+    from paramiko import SSHClient
 
 
 class AptModule(BaseModule):
     name = "apt"
 
-    def process(self, ssh_client: SSHClient) -> CmdResult:
+    def process(self, ssh_client: "SSHClient") -> CmdResult:
         self.check_required_params(["name", "state"])
-        package = self.params["name"]
+        package = shlex.quote(self.params["name"])
         desired = self.params.get("state", "present")
 
         check_cmd = f"dpkg-query -W -f='${{Status}}' {package} || echo not-installed"
@@ -43,7 +48,7 @@ class AptModule(BaseModule):
             exit_code=exit_code,
         )
 
-    def _run_cmd(self, ssh_client: SSHClient, command: str) -> CmdResult:
+    def _run_cmd(self, ssh_client: "SSHClient", command: str) -> CmdResult:
         stdin, stdout, stderr = ssh_client.exec_command(command)
         exit_code = stdout.channel.recv_exit_status()
         return CmdResult(
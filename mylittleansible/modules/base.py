@@ -1,10 +1,12 @@
 """Base module class for MyLittleAnsible."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
 from mylittleansible.utils import CmdResult
-from paramiko import SSHClient
+
+if TYPE_CHECKING:
+    from paramiko import SSHClient
 
 
 class BaseModule(ABC):
@@ -45,7 +47,7 @@ class BaseModule(ABC):
             raise ValueError(f"Missing required parameters: {', '.join(missing)}")
 
     @abstractmethod
-    def process(self, ssh_client: SSHClient) -> CmdResult:
+    def process(self, ssh_client: "SSHClient") -> CmdResult:
         """
         Process the module logic.
 
@@ -57,7 +59,7 @@ class BaseModule(ABC):
         """
         pass
 
-    def execute(self, ssh_client: SSHClient) -> CmdResult:
+    def execute(self, ssh_client: "SSHClient") -> CmdResult:
         """
         Execute the module with dry-run support.
 
@@ -76,6 +78,5 @@ class BaseModule(ABC):
             )
 
         result = self.process(ssh_client)
-        result.changed = self.changed and result.is_success
 
-        return result
+        return result._replace(changed=self.changed and result.is_success)
@@ -1,17 +1,24 @@
 """Command Module for MyLittleAnsible"""
 
+from typing import TYPE_CHECKING
+
 from mylittleansible.modules.base import BaseModule
 from mylittleansible.utils import CmdResult
-from paramiko import SSHClient
+
+if TYPE_CHECKING:
+    from paramiko import SSHClient
 
 
 class CommandModule(BaseModule):
     name = "command"
 
-    def process(self, ssh_client: SSHClient) -> CmdResult:
+    def render_shell(self) -> str:
+        """Return the shell command this task runs remotely."""
         self.check_required_params(["cmd"])
+        return self.params["cmd"]
 
-        cmd = self.params["cmd"]
+    def process(self, ssh_client: "SSHClient") -> CmdResult:
+        cmd = self.render_shell()
         stdin, stdout, stderr = ssh_client.exec_command(cmd)
         exit_code = stdout.channel.recv_exit_status()
 
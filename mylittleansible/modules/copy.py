@@ -1,22 +1,32 @@
 """Copy Module for MyLittleAnsible"""
 
+import shlex
+from typing import TYPE_CHECKING
+
 from mylittleansible.modules.base import BaseModule
 from mylittleansible.utils import CmdResult
-from paramiko import SSHClient
-import os
+
+if TYPE_CHECKING:
+    from paramiko import SSHClient
 
 
 class CopyModule(BaseModule):
     name = "copy"
 
-    def process(self, ssh_client: SSHClient) -> CmdResult:
+    def process(self, ssh_client: "SSHClient") -> CmdResult:
         self.check_required_params(["src", "dest"])
 
         src = self.params["src"]
         dest = self.params["dest"]
         backup = self.params.get("backup", False)
 
-        if not os.path.exists(src):
+        # Open the source ourselves (no exists() pre-check, same single
+        # syscall) in a tight try: paramiko also raises FileNotFoundError
+        # for a missing remote dest directory, so catching it around the
+        # transfer would blame the source file for remote errors.
+        try:
+            local_file = open(src, "rb")
+        except FileNotFoundError:
             return CmdResult(
                 stdout="",
                 stderr=f"Source file does not exist: {src}",
@@ -26,14 +36,16 @@ class CopyModule(BaseModule):
         sftp = ssh_client.open_sftp()
         try:
             if backup:
-                backup_cmd = f"cp {dest} {dest}.bak"
+                quoted_dest = shlex.quote(dest)
+                backup_cmd = f"cp {quoted_dest} {quoted_dest}.bak"
                 ssh_client.exec_command(backup_cmd)
 
-            sftp.put(src, dest)
+            sftp.putfo(local_file, dest)
             return CmdResult(stdout=f"Copied {src} to {dest}", stderr="", exit_code=0)
 
         except Exception as e:
             return CmdResult(stdout="", stderr=str(e), exit_code=1)
 
         finally:
+            local_file.close()
             sftp.close()
@@ -1,17 +1,23 @@
 """Service Module for MyLittleAnsible"""
 
+import shlex
+from typing import TYPE_CHECKING
+
 from mylittleansible.modules.base import BaseModule
 from mylittleansible.utils import CmdResult
-from paramiko import SSHClient
+
+if TYPE_CHECKING:
+    from paramiko import SSHClient
 
 
 class ServiceModule(BaseModule):
     name = "service"
 
-    def process(self, ssh_client: SSHClient) -> CmdResult:
+    def render_shell(self) -> str:
+        """Return the shell command this task runs remotely."""
         self.check_required_params(["name", "state"])
 
-        service_name = self.params["name"]
+        service_name = shlex.quote(self.params["name"])
         desired_state = self.params.get("state", "started")
 
         cmd_map = {
@@ -23,11 +29,16 @@ class ServiceModule(BaseModule):
         }
 
         if desired_state not in cmd_map:
-            return CmdResult(
-                stdout="", stderr=f"Unsupported state {desired_state}", exit_code=1
-            )
+            raise ValueError(f"Unsupported state {desired_state}")
+
+        return cmd_map[desired_state]
+
+    def process(self, ssh_client: "SSHClient") -> CmdResult:
+        try:
+            cmd = self.render_shell()
+        except ValueError as e:
+            return CmdResult(stdout="", stderr=str(e), exit_code=1)
 
-        cmd = cmd_map[desired_state]
         stdin, stdout, stderr = ssh_client.exec_command(cmd)
         exit_code = stdout.channel.recv_exit_status()
 
@@ -1,21 +1,28 @@
 """Sysctl Module for MyLittleAnsible"""
 
+import shlex
+from typing import TYPE_CHECKING
+
 from mylittleansible.modules.base import BaseModule
 from mylittleansible.utils import CmdResult
-from paramiko import SSHClient
+
+if TYPE_CHECKING:
+    from paramiko import SSHClient
 
 
 class SysctlModule(BaseModule):
     name = "sysctl"
 
-    def process(self, ssh_client: SSHClient) -> CmdResult:
+    def render_shell(self) -> str:
+        """Return the shell command this task runs remotely."""
         self.check_required_params(["name", "value"])
-
         name = self.params["name"]
         value = self.params["value"]
+        return f"sudo sysctl -w {shlex.quote(f'{name}={value}')}"
 
+    def process(self, ssh_client: "SSHClient") -> CmdResult:
         # Apply sysctl setting via command
-        cmd = f"sudo sysctl -w {name}={value}"
+        cmd = self.render_shell()
         stdin, stdout, stderr = ssh_client.exec_command(cmd)
         exit_code = stdout.channel.recv_exit_status()
 
@@ -1,31 +1,29 @@
 """Template Module for MyLittleAnsible"""
 
-from mylittleansible.modules.base import BaseModule
-from mylittleansible.utils import CmdResult
-from paramiko import SSHClient
 import os
 import tempfile
-from jinja2 import Environment, FileSystemLoader
+from typing import TYPE_CHECKING
+
+from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+
+from mylittleansible.modules.base import BaseModule
+from mylittleansible.utils import CmdResult
+
+if TYPE_CHECKING:
+    from paramiko import SSHClient
 
 
 class TemplateModule(BaseModule):
     name = "template"
 
-    def process(self, ssh_client: SSHClient) -> CmdResult:
+    def process(self, ssh_client: "SSHClient") -> CmdResult:
         self.check_required_params(["src", "dest"])
 
         src = self.params["src"]
         dest = self.params["dest"]
 
-        # Vérifier que le fichier source existe
-        if not os.path.exists(src):
-            return CmdResult(
-                stdout="",
-                stderr=f"Template file not found: {src}",
-                exit_code=1,
-            )
-
-        # Charger et rendre le template Jinja2
+        # Charger et rendre le template Jinja2 (pas de test d'existence
+        # préalable : le loader ouvre le fichier lui-même)
         template_dir = os.path.dirname(os.path.abspath(src))
         template_file = os.path.basename(src)
 
@@ -33,6 +31,12 @@ class TemplateModule(BaseModule):
             env = Environment(loader=FileSystemLoader(template_dir))
             template = env.get_template(template_file)
             rendered_content = template.render(self.params)
+        except TemplateNotFound:
+            return CmdResult(
+                stdout="",
+                stderr=f"Template file not found: {src}",
+                exit_code=1,
+            )
         except Exception as e:
             return CmdResult(
                 stdout="", stderr=f"Template rendering error: {str(e)}", exit_code=1
@@ -1,14 +1,19 @@
 """Playbook parser and executor for MyLittleAnsible."""
 
+import asyncio
 import logging
+import re
+import sys
+import threading
 import time
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Dict, List
 
 
 import yaml
 
 
-from mylittleansible.inventory import Inventory
+from mylittleansible.inventory import Host, Inventory
 from mylittleansible.modules import (
     AptModule,
     CommandModule,
@@ -17,8 +22,11 @@ from mylittleansible.modules import (
     SysctlModule,
     TemplateModule,
 )
-from mylittleansible.ssh_manager import SSHManager
 from mylittleansible.utils import TaskResult, PlaybookResult
+from mylittleansible.yaml_cache import load_cached
+
+if TYPE_CHECKING:
+    from mylittleansible.ssh_manager import SSHManager
 
 
 logger = logging.getLogger("mla")
@@ -35,6 +43,10 @@ MODULES = {
 }
 
 
+# Marker emitted after each step of a batched script: ::MLA_STEP_<idx>::<rc>
+_STEP_MARKER = re.compile(r"::MLA_STEP_(\d+)::(\d+)")
+
+
 class PlaybookError(Exception):
     """Exception raised for playbook-related errors."""
 
@@ -42,7 +54,12 @@ class PlaybookError(Exception):
 class Playbook:
     """Represents a playbook with a list of tasks."""
 
-    def __init__(self, tasks: List[Dict[str, Any]], dry_run: bool = False) -> None:
+    def __init__(
+        self,
+        tasks: List[Dict[str, Any]],
+        dry_run: bool = False,
+        forks: int = 16,
+    ) -> None:
         """
         Initialize a playbook.
 
@@ -50,12 +67,14 @@ class Playbook:
         Args:
             tasks: List of task dictionaries
             dry_run: If True, simulate without executing
+            forks: Maximum number of hosts to execute on in parallel
         """
         self.tasks = tasks
         self.dry_run = dry_run
+        self.forks = forks
 
     @staticmethod
-    def load(file_path: str, dry_run: bool = False) -> "Playbook":
+    def load(file_path: str, dry_run: bool = False, forks: int = 16) -> "Playbook":
         """
         Load a playbook from a YAML file.
 
@@ -63,6 +82,7 @@ class Playbook:
         Args:
             file_path: Path to the YAML playbook file
             dry_run: If True, simulate without executing
+            forks: Maximum number of hosts to execute on in parallel
 
 
         Returns:
@@ -74,8 +94,7 @@ class Playbook:
             PlaybookError: If YAML is invalid
         """
         try:
-            with open(file_path, "r") as f:
-                data = yaml.safe_load(f)
+            data = load_cached(file_path)
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Playbook file not found: {file_path}") from e
         except yaml.YAMLError as e:
@@ -84,13 +103,22 @@ class Playbook:
         if not isinstance(data, list):
             raise PlaybookError("Playbook must be a list of tasks")
 
+        # Intern module names so the MODULES lookups in the hot loop
+        # compare by identity against the interned literals in source.
+        for task in data:
+            if isinstance(task, dict) and isinstance(task.get("module"), str):
+                task["module"] = sys.intern(task["module"])
+
         logger.info("Loaded playbook with %d task(s)", len(data))
-        return Playbook(data, dry_run=dry_run)
+        return Playbook(data, dry_run=dry_run, forks=forks)
 
     def execute(self, inventory: Inventory) -> PlaybookResult:
         """
         Execute all tasks on all hosts in inventory.
 
+        Hosts run concurrently in a bounded thread pool (SSH work is
+        I/O-bound); tasks on a given host still run sequentially.
+
 
         Args:
             inventory: Target inventory with hosts
@@ -103,91 +131,563 @@ class Playbook:
         Raises:
             PlaybookError: If execution fails
         """
+        self.validate(inventory)
+
         result = PlaybookResult()
+        result_lock = threading.Lock()
         logger.info("Executing playbook...")
 
+        if not inventory.hosts:
+            self._print_summary(result)
+            return result
+
+        runnable, skipped = self._resolve_modules()
+
+        max_workers = min(len(inventory.hosts), self.forks or 16)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._run_on_host, host, runnable): host.name
+                for host in inventory.host_list
+            }
+
+            for future in as_completed(futures):
+                for task_result in future.result():
+                    with result_lock:
+                        result.add_result(task_result)
+
+        for task_result in self._skipped_results(inventory, skipped):
+            result.add_result(task_result)
+
+        self._print_summary(result)
+        return result
+
+    def validate(self, inventory: Inventory, backend: str = "paramiko") -> None:
+        """
+        Check tasks and inventory before any SSH work starts.
+
+        Without this pass, an unknown module or a host without an
+        ssh_address only surfaced once execution reached it, potentially
+        after connecting everywhere and running most of the playbook.
+        The same goes for modules the asyncssh backend cannot run.
+
+
+        Args:
+            inventory: Target inventory with hosts
+            backend: SSH backend the playbook will run on
+
+
+        Raises:
+            PlaybookError: If a task references an unknown module, a
+                module unsupported on the selected backend, or a host is
+                missing its ssh_address
+        """
+        errors = []
+
+        for task_idx, task in enumerate(self.tasks, 1):
+            module_name = task.get("module")
+            module_class = MODULES.get(module_name) if module_name else None
+            if module_name and module_class is None:
+                errors.append(
+                    f"Task {task_idx} references unknown module '{module_name}'"
+                )
+            elif (
+                backend == "asyncssh"
+                and module_class is not None
+                and not self.dry_run
+                and not hasattr(module_class, "render_shell")
+            ):
+                errors.append(
+                    f"Task {task_idx} module '{module_name}' is not "
+                    "supported by the asyncssh backend"
+                )
+
         for host_name, host_config in inventory.hosts.items():
-            logger.info("=" * 60)
-            logger.info("Executing tasks on host: %s", host_name)
-            logger.info("=" * 60)
-
-            # IMPORTANT : utiliser les clés définies dans inventory.yml
-            ssh_manager = SSHManager(
-                hostname=host_config.get("ssh_address"),
-                port=host_config.get("ssh_port", 22),
-                username=host_config.get("ssh_user"),
-                password=host_config.get("ssh_password"),
-                key_file=host_config.get("ssh_key_file"),
+            if not isinstance(host_config, dict) or not host_config.get(
+                "ssh_address"
+            ):
+                errors.append(f"Host '{host_name}' has no ssh_address")
+
+        if errors:
+            raise PlaybookError("; ".join(errors))
+
+    def _resolve_modules(self) -> tuple:
+        """
+        Resolve each task's module class once, before the host loops.
+
+        Tasks with a missing or unknown module are warned about a single
+        time here instead of once per host, and excluded from execution;
+        callers report them as SKIPPED per host so the summary still
+        accounts for them.
+
+        Returns:
+            Tuple of (runnable, skipped): runnable is a list of
+            (task_idx, task) pairs, each task annotated with its module
+            class under '_cls' and its display label under '_label';
+            skipped is a list of (task_idx, label, message) entries for
+            the excluded tasks
+        """
+        runnable: List = []
+        skipped: List = []
+
+        for task_idx, task in enumerate(self.tasks, 1):
+            module_name = task.get("module")
+
+            if not module_name:
+                logger.warning(
+                    "Task %d has no module specified - skipping", task_idx
+                )
+                skipped.append(
+                    (task_idx, f"Task {task_idx}", "No module specified")
+                )
+                continue
+
+            module_class = MODULES.get(module_name)
+            if module_class is None:
+                logger.warning(
+                    "Task %d uses unknown module '%s' - skipping",
+                    task_idx,
+                    module_name,
+                )
+                skipped.append(
+                    (
+                        task_idx,
+                        f"{module_name} (Task {task_idx})",
+                        f"Unknown module: {module_name}",
+                    )
+                )
+                continue
+
+            task["_cls"] = module_class
+            # The label is the same on every host; build it once here
+            # instead of once per (task, host).
+            task["_label"] = f"{module_name} (Task {task_idx})"
+            runnable.append((task_idx, task))
+
+        return runnable, skipped
+
+    @staticmethod
+    def _skipped_results(inventory: Inventory, skipped: List) -> List[TaskResult]:
+        """Build one SKIPPED result per (host, skipped task) pair."""
+        return [
+            TaskResult(
+                host=host.name,
+                task_name=label,
+                status="SKIPPED",
+                message=message,
             )
+            for host in inventory.host_list
+            for _task_idx, label, message in skipped
+        ]
+
+    def _run_on_host(
+        self,
+        host: Host,
+        runnable: List,
+    ) -> List[TaskResult]:
+        """Execute all tasks on a single host and return their results."""
+        # Imported here so dry runs and --help skip paramiko's import cost.
+        from mylittleansible.ssh_manager import SSHManager
+
+        host_name = host.name
+        task_results: List[TaskResult] = []
+
+        logger.info("=" * 60)
+        logger.info("Executing tasks on host: %s", host_name)
+        logger.info("=" * 60)
+
+        ssh_manager = SSHManager(
+            hostname=host.address,
+            port=host.port,
+            username=host.user,
+            password=host.password,
+            key_file=host.key_file,
+        )
 
 
-            try:
+        try:
+            # Dry runs never touch the remote side, so skip the
+            # handshake (and with it paramiko's deferred import).
+            if not self.dry_run:
                 ssh_manager.connect()
 
-                for task_idx, task in enumerate(self.tasks, 1):
-                    task_result = self._execute_task(
-                        host_name, task, ssh_manager, task_idx
+            for group in self._coalesce(runnable):
+                if len(group) == 1:
+                    task_idx, task = group[0]
+                    group_results = [
+                        self._execute_task(host_name, task, ssh_manager, task_idx)
+                    ]
+                else:
+                    group_results = self._execute_batch(
+                        host_name, group, ssh_manager
                     )
-                    result.add_result(task_result)
-
-                    if task_result.status == "FAILED":
-                        logger.error(
-                            "Task failed on host %s. Stopping execution on this host.",
-                            host_name,
-                        )
-                        break
-
-            except Exception as e:
-                logger.error("Error on host %s: %s", host_name, str(e))
-                result.add_result(
-                    TaskResult(
-                        host=host_name,
-                        task_name="connection",
-                        status="FAILED",
-                        message=str(e),
+
+                task_results.extend(group_results)
+
+                if any(r.status == "FAILED" for r in group_results):
+                    logger.error(
+                        "Task failed on host %s. Stopping execution on this host.",
+                        host_name,
                     )
+                    break
+
+        except Exception as e:
+            logger.error("Error on host %s: %s", host_name, e)
+            task_results.append(
+                TaskResult(
+                    host=host_name,
+                    task_name="connection",
+                    status="FAILED",
+                    message=str(e),
                 )
+            )
+
+        finally:
+            ssh_manager.close()
+
+        return task_results
+
+    def execute_async(self, inventory: Inventory) -> PlaybookResult:
+        """
+        Execute the playbook on the asyncssh backend.
+
+        All hosts connect and run on a single event loop, bounded by
+        self.forks, so connection handshakes overlap instead of queueing
+        behind threads. Only modules that expose render_shell() (and all
+        dry-run tasks) are supported on this backend; validation rejects
+        unsupported modules before any connection is made.
 
-            finally:
-                ssh_manager.close()
+
+        Args:
+            inventory: Target inventory with hosts
+
+
+        Returns:
+            PlaybookResult with aggregated results
+        """
+        return asyncio.run(self._execute_async(inventory))
+
+    async def _execute_async(self, inventory: Inventory) -> PlaybookResult:
+        """Async driver behind execute_async."""
+        self.validate(inventory, backend="asyncssh")
+
+        result = PlaybookResult()
+        logger.info("Executing playbook...")
+
+        if not inventory.hosts:
+            self._print_summary(result)
+            return result
+
+        runnable, skipped = self._resolve_modules()
+        semaphore = asyncio.Semaphore(self.forks or 16)
+
+        async def run_host(host):
+            async with semaphore:
+                return await self._run_on_host_async(host, runnable)
+
+        host_results = await asyncio.gather(
+            *(run_host(host) for host in inventory.host_list)
+        )
+
+        for task_results in host_results:
+            for task_result in task_results:
+                result.add_result(task_result)
+
+        for task_result in self._skipped_results(inventory, skipped):
+            result.add_result(task_result)
 
         self._print_summary(result)
         return result
 
-    def _execute_task(
+    async def _run_on_host_async(
+        self,
+        host: Host,
+        runnable: List,
+    ) -> List[TaskResult]:
+        """Async counterpart of _run_on_host for the asyncssh backend."""
+        from mylittleansible.async_ssh_manager import AsyncSSHManager
+
+        host_name = host.name
+        task_results: List[TaskResult] = []
+
+        logger.info("=" * 60)
+        logger.info("Executing tasks on host: %s", host_name)
+        logger.info("=" * 60)
+
+        ssh_manager = AsyncSSHManager(
+            hostname=host.address,
+            port=host.port,
+            username=host.user,
+            password=host.password,
+            key_file=host.key_file,
+        )
+
+        try:
+            # Dry runs never touch the remote side, so skip the handshake.
+            if not self.dry_run:
+                await ssh_manager.connect()
+
+            for task_idx, task in runnable:
+                task_result = await self._execute_task_async(
+                    host_name, task, ssh_manager, task_idx
+                )
+                task_results.append(task_result)
+
+                if task_result.status == "FAILED":
+                    logger.error(
+                        "Task failed on host %s. Stopping execution on this host.",
+                        host_name,
+                    )
+                    break
+
+        except Exception as e:
+            logger.error("Error on host %s: %s", host_name, e)
+            task_results.append(
+                TaskResult(
+                    host=host_name,
+                    task_name="connection",
+                    status="FAILED",
+                    message=str(e),
+                )
+            )
+
+        finally:
+            await ssh_manager.close()
+
+        return task_results
+
+    async def _execute_task_async(
         self,
         host_name: str,
         task: Dict[str, Any],
-        ssh_manager: SSHManager,
+        ssh_manager,
         task_idx: int,
     ) -> TaskResult:
-        """Execute a single task on a host."""
-        module_name = task.get("module")
+        """Execute a single task on a host via the asyncssh backend."""
+        module_name = task["module"]
         params = task.get("params", {})
 
-        if not module_name:
-            logger.warning("Task %d has no module specified", task_idx)
-            return TaskResult(
+        module = task["_cls"](params, dry_run=self.dry_run)
+
+        try:
+            start_time = time.time()
+
+            if self.dry_run:
+                # The dry-run branch of execute() never touches the client.
+                cmd_result = module.execute(None)
+            elif hasattr(module, "render_shell"):
+                cmd_result = await ssh_manager.run_command(module.render_shell())
+                cmd_result = cmd_result._replace(
+                    changed=module.changed and cmd_result.is_success
+                )
+            else:
+                return TaskResult(
+                    host=host_name,
+                    task_name=task["_label"],
+                    status="FAILED",
+                    message=(
+                        f"Module {module_name} is not supported by the "
+                        "asyncssh backend"
+                    ),
+                )
+
+            duration = time.time() - start_time
+
+            status = "OK" if cmd_result.is_success else "FAILED"
+            message = cmd_result.stdout or cmd_result.stderr
+
+            task_result = TaskResult(
                 host=host_name,
-                task_name=f"Task {task_idx}",
-                status="SKIPPED",
-                message="No module specified",
+                task_name=task["_label"],
+                status=status,
+                changed=cmd_result.changed,
+                message=message,
+                duration=duration,
             )
 
-        if module_name not in MODULES:
-            logger.error("Unknown module: %s", module_name)
+            logger.info("%s", task_result)
+            return task_result
+
+        except Exception as e:
+            logger.error(
+                "Exception in task %d on host %s: %s", task_idx, host_name, e
+            )
             return TaskResult(
                 host=host_name,
-                task_name=f"{module_name} (Task {task_idx})",
+                task_name=task["_label"],
                 status="FAILED",
-                message=f"Unknown module: {module_name}",
+                message=str(e),
             )
 
+    def _coalesce(self, indexed_tasks: List) -> List[List]:
+        """
+        Group consecutive shell-renderable tasks into batches.
+
+        Tasks whose module exposes render_shell() can be shipped to the
+        host as one script instead of one SSH round-trip each. Other
+        tasks (and all tasks in dry-run mode) form single-entry groups.
+
+        Args:
+            indexed_tasks: List of (task_idx, task) pairs
+
+        Returns:
+            List of groups, each a list of (task_idx, task) pairs
+        """
+        groups: List[List] = []
+        current: List = []
+
+        for task_idx, task in indexed_tasks:
+            module_class = task["_cls"]
+            batchable = not self.dry_run and hasattr(module_class, "render_shell")
+
+            if batchable:
+                current.append((task_idx, task))
+            else:
+                if current:
+                    groups.append(current)
+                    current = []
+                groups.append([(task_idx, task)])
+
+        if current:
+            groups.append(current)
+
+        return groups
+
+    def _execute_batch(
+        self,
+        host_name: str,
+        group: List,
+        ssh_manager: "SSHManager",
+    ) -> List[TaskResult]:
+        """
+        Run a group of shell-renderable tasks as one remote invocation.
+
+        The rendered commands are joined into a single script with a
+        status marker echoed after each step, trading one SSH round-trip
+        per task for one per group. A failing step skips the remaining
+        steps, matching the sequential stop-on-failure behavior.
+        """
+        try:
+            steps = []
+            for task_idx, task in group:
+                module = task["_cls"](task.get("params", {}), dry_run=self.dry_run)
+                steps.append((task_idx, task["_label"], module.render_shell()))
+        except Exception:
+            # A task that cannot be rendered falls back to the
+            # round-trip-per-task path, which reports the error as usual.
+            results = []
+            for task_idx, task in group:
+                task_result = self._execute_task(
+                    host_name, task, ssh_manager, task_idx
+                )
+                results.append(task_result)
+                if task_result.status == "FAILED":
+                    break
+            return results
+
+        # Each command goes on its own line: joined with ';' a trailing
+        # comment or semicolon in a rendered command (both valid in the
+        # per-task path) would turn the whole script into a syntax error.
+        lines = ["_mla_rc=0"]
+        for task_idx, _, shell_cmd in steps:
+            lines.append("if [ $_mla_rc -eq 0 ]; then")
+            lines.append(shell_cmd)
+            lines.append("_mla_rc=$?")
+            lines.append("fi")
+            lines.append(f'echo "::MLA_STEP_{task_idx}::$_mla_rc"')
+        script = "\n".join(lines)
+
+        start_time = time.time()
+
+        try:
+            cmd_result = ssh_manager.run_command(script)
+        except Exception as e:
+            logger.error(
+                "Batch execution failed on host %s: %s", host_name, e
+            )
+            first_idx, first_label, _ = steps[0]
+            return [
+                TaskResult(
+                    host=host_name,
+                    task_name=first_label,
+                    status="FAILED",
+                    message=str(e),
+                )
+            ]
+
+        duration = (time.time() - start_time) / len(steps)
+
+        # Walk the markers in step order, slicing stdout so each step
+        # keeps the output it produced, as the per-task path does. A task
+        # that prints a marker itself can at worst forge its own step's
+        # status, not an arbitrary one.
+        stdout = cmd_result.stdout
+        matches = list(_STEP_MARKER.finditer(stdout))
+        step_codes: Dict[int, int] = {}
+        step_output: Dict[int, str] = {}
+        pos = 0
+        match_i = 0
+        for task_idx, _, _ in steps:
+            while (
+                match_i < len(matches)
+                and int(matches[match_i].group(1)) != task_idx
+            ):
+                match_i += 1
+            if match_i == len(matches):
+                break
+            match = matches[match_i]
+            step_codes[task_idx] = int(match.group(2))
+            step_output[task_idx] = stdout[pos : match.start()].strip()
+            pos = match.end()
+            match_i += 1
+
+        results = []
+        for task_idx, task_label, _ in steps:
+            exit_code = step_codes.get(task_idx)
+
+            if exit_code is None:
+                results.append(
+                    TaskResult(
+                        host=host_name,
+                        task_name=task_label,
+                        status="FAILED",
+                        message="No status marker in batch output",
+                    )
+                )
+                break
+
+            output = step_output.get(task_idx, "")
+            status = "OK" if exit_code == 0 else "FAILED"
+            task_result = TaskResult(
+                host=host_name,
+                task_name=task_label,
+                status=status,
+                changed=exit_code == 0,
+                message=output if exit_code == 0 else (output or cmd_result.stderr),
+                duration=duration,
+            )
+
+            logger.info("%s", task_result)
+            results.append(task_result)
+
+            if status == "FAILED":
+                break
+
+        return results
+
+    def _execute_task(
+        self,
+        host_name: str,
+        task: Dict[str, Any],
+        ssh_manager: "SSHManager",
+        task_idx: int,
+    ) -> TaskResult:
+        """Execute a single task on a host."""
+        params = task.get("params", {})
+
         try:
             start_time = time.time()
 
-            module_class = MODULES[module_name]
-            module = module_class(params, dry_run=self.dry_run)
+            module = task["_cls"](params, dry_run=self.dry_run)
             cmd_result = module.execute(ssh_manager.client)
 
             duration = time.time() - start_time
@@ -197,23 +697,23 @@ class Playbook:
 
             task_result = TaskResult(
                 host=host_name,
-                task_name=f"{module_name} (Task {task_idx})",
+                task_name=task["_label"],
                 status=status,
                 changed=cmd_result.changed,
                 message=message,
                 duration=duration,
             )
 
-            logger.info(str(task_result))
+            logger.info("%s", task_result)
             return task_result
 
         except Exception as e:
             logger.error(
-                "Exception in task %d on host %s: %s", task_idx, host_name, str(e)
+                "Exception in task %d on host %s: %s", task_idx, host_name, e
             )
             return TaskResult(
                 host=host_name,
-                task_name=f"{module_name} (Task {task_idx})",
+                task_name=task["_label"],
                 status="FAILED",
                 message=str(e),
             )
@@ -221,6 +721,6 @@ class Playbook:
     def _print_summary(self, result: PlaybookResult) -> None:
         """Print a summary of the playbook execution."""
         logger.info("=" * 60)
-        logger.info(str(result))
+        logger.info("%s", result)
         logger.info("=" * 60)
         logger.info("Playbook execution completed successfully")
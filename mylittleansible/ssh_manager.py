@@ -1,17 +1,59 @@
 """SSH connection manager for MyLittleAnsible."""
 
 import logging
+import select
 import socket
-from typing import Optional
+import threading
+from typing import TYPE_CHECKING, Dict, Optional
 
-import paramiko
-from paramiko import SSHClient, AutoAddPolicy
+from mylittleansible.utils import (
+    CmdResult,
+    get_all_ssh_key_paths,
+    get_current_user,
+    resolve_key_for,
+)
 
-from mylittleansible.utils import get_ssh_key_path
+if TYPE_CHECKING:
+    from paramiko import PKey, SSHClient
 
 logger = logging.getLogger("ssh")
 
 
+# Parsed private keys, shared across hosts that use the same key file so
+# the PEM decode is paid once per process instead of once per connect.
+_PKEY_CACHE: Dict[str, "PKey"] = {}
+_PKEY_CACHE_LOCK = threading.Lock()
+
+
+def _load_pkey(key_file: str) -> Optional["PKey"]:
+    """
+    Parse a private key file once and cache the result.
+
+    Returns None when the key cannot be parsed (e.g. passphrase
+    protected); callers should fall back to key_filename and let
+    Paramiko handle it.
+    """
+    import paramiko
+
+    with _PKEY_CACHE_LOCK:
+        if key_file in _PKEY_CACHE:
+            return _PKEY_CACHE[key_file]
+
+    pkey = None
+    for key_class in (paramiko.Ed25519Key, paramiko.ECDSAKey, paramiko.RSAKey):
+        try:
+            pkey = key_class.from_private_key_file(key_file)
+            break
+        except (paramiko.SSHException, IOError):
+            continue
+
+    if pkey is not None:
+        with _PKEY_CACHE_LOCK:
+            _PKEY_CACHE[key_file] = pkey
+
+    return pkey
+
+
 class SSHConnectionError(Exception):
     """Custom exception for SSH connection related errors."""
 
@@ -32,24 +74,36 @@ class SSHManager:
     ) -> None:
         self.hostname = hostname
         self.port = port
-        self.username = username
+        self.username = username or get_current_user()
         self.password = password
         self.key_file = key_file
         self.timeout = timeout
-        self.client: Optional[SSHClient] = None
+        self.client: Optional["SSHClient"] = None
 
-    def connect(self) -> SSHClient:
+    def connect(self) -> "SSHClient":
         """
         Establish an SSH connection and return the connected SSHClient instance.
         """
+        # Imported here so that dry runs and --help never pay paramiko's
+        # sizeable import cost.
+        import paramiko
+        from paramiko import AutoAddPolicy, SSHClient
+
         if self.client is not None:
-            return self.client
+            # Reuse the cached connection when its transport is still up.
+            # transport.is_active() is a local check, so the fast path
+            # costs no network round-trip.
+            transport = self.client.get_transport()
+            if transport is not None and transport.is_active():
+                return self.client
+            self.client.close()
+            self.client = None
 
         logger.info(
             "Connecting to %s:%s as %s",
             self.hostname,
             self.port,
-            self.username or "<default>",
+            self.username,
         )
 
         client = SSHClient()
@@ -69,14 +123,31 @@ class SSHManager:
                 connect_kwargs["password"] = self.password
 
             if self.key_file:
-                connect_kwargs["key_filename"] = self.key_file
+                # Cached per (user, host): parallel tasks on the same
+                # host resolve (and ~-expand) the key once.
+                key_path = (
+                    resolve_key_for(self.username, self.hostname, self.key_file)
+                    or self.key_file
+                )
+                pkey = _load_pkey(key_path)
+                if pkey is not None:
+                    connect_kwargs["pkey"] = pkey
+                else:
+                    connect_kwargs["key_filename"] = key_path
             else:
-                # Use default SSH key (e.g. ~/.ssh/id_rsa) if available
-                default_key = get_ssh_key_path()
-                if default_key:
-                    connect_kwargs["key_filename"] = default_key
+                # Offer every default key at once so Paramiko can try
+                # them within one handshake rather than one connection
+                # attempt per key.
+                default_keys = get_all_ssh_key_paths()
+                if default_keys:
+                    connect_kwargs["key_filename"] = default_keys
 
             client.connect(**connect_kwargs)
+            transport = client.get_transport()
+            if transport is not None:
+                # Keep the shared transport alive between tasks so idle
+                # connections are not torn down by the remote side.
+                transport.set_keepalive(30)
             self.client = client
             logger.info("Successfully connected to %s:%s", self.hostname, self.port)
             return client
@@ -93,19 +164,76 @@ class SSHManager:
         Execute a command on the remote host.
         Returns (stdin, stdout, stderr).
         """
-        if self.client is None:
-            self.connect()
+        self.connect()
 
         assert self.client is not None
         logger.debug("Executing command on %s: %s", self.hostname, command)
         return self.client.exec_command(command)
 
+    def run_command(self, command: str) -> CmdResult:
+        """
+        Run a command over a fresh channel on the shared transport.
+
+        Channels are cheap to open compared to a full connect, so many
+        commands can be multiplexed over the one authenticated
+        connection (the Paramiko equivalent of OpenSSH ControlMaster).
+        """
+        client = self.connect()
+
+        transport = client.get_transport()
+        if transport is None:
+            raise SSHConnectionError(
+                f"No active transport to {self.hostname}:{self.port}"
+            )
+
+        logger.debug("Executing command on %s: %s", self.hostname, command)
+        channel = transport.open_session()
+        stdout_buf = bytearray()
+        stderr_buf = bytearray()
+
+        try:
+            channel.exec_command(command)
+
+            # Drain stdout and stderr together rather than sequentially,
+            # so a command filling one stream's window cannot stall the
+            # other.
+            while True:
+                readable, _, _ = select.select([channel], [], [], 1.0)
+                if readable:
+                    while channel.recv_ready():
+                        stdout_buf += channel.recv(65536)
+                    while channel.recv_stderr_ready():
+                        stderr_buf += channel.recv_stderr(65536)
+
+                if (
+                    channel.exit_status_ready()
+                    and not channel.recv_ready()
+                    and not channel.recv_stderr_ready()
+                ):
+                    break
+
+            exit_code = channel.recv_exit_status()
+
+            # Pick up anything that arrived between the last poll and
+            # the exit status.
+            while channel.recv_ready():
+                stdout_buf += channel.recv(65536)
+            while channel.recv_stderr_ready():
+                stderr_buf += channel.recv_stderr(65536)
+        finally:
+            channel.close()
+
+        return CmdResult(
+            stdout=stdout_buf.decode("utf-8"),
+            stderr=stderr_buf.decode("utf-8"),
+            exit_code=exit_code,
+        )
+
     def open_sftp(self):
         """
         Open an SFTP session on the existing SSH connection.
         """
-        if self.client is None:
-            self.connect()
+        self.connect()
 
         assert self.client is not None
         logger.debug("Opening SFTP session to %s", self.hostname)
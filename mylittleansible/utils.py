@@ -2,13 +2,19 @@
 
 import logging
 import os
+import time
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
 
 
-@dataclass
-class CmdResult:
-    """Result of a command execution."""
+class CmdResult(NamedTuple):
+    """Result of a command execution.
+
+    A NamedTuple: fields live in a C-backed tuple, so one instance per
+    remote command stays cheap to allocate and scan during aggregation.
+    Results are immutable; use _replace() to derive an updated one.
+    """
 
     stdout: str
     stderr: str
@@ -80,15 +86,149 @@ class PlaybookResult:
         return self.failed_count == 0
 
 
-def get_ssh_key_path() -> Optional[str]:
-    """Get the default SSH key path."""
-    home = os.path.expanduser("~")
-    default_key = os.path.join(home, ".ssh", "id_rsa")
-
-    if os.path.exists(default_key):
-        return default_key
-
-    return None
+# Computed once at import: the process's user cannot change mid-run, so
+# per-call os.getenv lookups on the connection path would be wasted work.
+# environ.get skips the os.getenv wrapper frame on top of the same dict.
+_env = os.environ
+_CURRENT_USER = _env.get("USERNAME") or _env.get("USER") or "root"
+
+# Invariant for the process lifetime; expanduser hits os.environ on
+# every call, so resolve it once here.
+_HOME_SSH = os.path.join(os.path.expanduser("~"), ".ssh")
+# Preference baked into integer ranks: the common exact names resolve
+# with one dict lookup, suffixed variants (id_ed25519_work) fall back to
+# a prefix scan, anything else ranks last.
+_KEY_RANK = {"id_ed25519": 0, "id_ecdsa": 1, "id_rsa": 2, "id_dsa": 3}
+_DEFAULT_KEY_RANK = len(_KEY_RANK)
+
+
+def _key_preference(name: str) -> Tuple[int, str]:
+    """Sort key ranking modern key types first, exact names before variants."""
+    rank = _KEY_RANK.get(name)
+    if rank is None:
+        rank = next(
+            (r for prefix, r in _KEY_RANK.items() if name.startswith(prefix)),
+            _DEFAULT_KEY_RANK,
+        )
+    return (rank, name)
+
+
+def get_current_user() -> str:
+    """Return the local username, used as the default SSH login."""
+    return _CURRENT_USER
+
+
+@lru_cache(maxsize=32)
+def get_ssh_key_path(ssh_key_file: Optional[str] = None) -> Optional[str]:
+    """Get the SSH key path to use.
+
+    An explicitly provided key is probed with a single os.stat and
+    returned as an absolute path; without one, the default keys in
+    ~/.ssh are searched. The result is memoized: one connection attempt
+    per host would otherwise re-stat the same key file every time. Call
+    get_ssh_key_path.cache_clear() if keys change mid-process.
+    """
+    if ssh_key_file:
+        # Inventories commonly spell keys as ~/.ssh/...; expand before
+        # probing so the tilde is not taken literally.
+        expanded = os.path.expanduser(ssh_key_file)
+        try:
+            os.stat(expanded)
+        except OSError:
+            return None
+        # abspath is pure string work for already-absolute paths, unlike
+        # Path.resolve() which lstats every component.
+        return expanded if os.path.isabs(expanded) else os.path.abspath(expanded)
+
+    candidates = _default_key_candidates()
+    return candidates[0] if candidates else None
+
+
+@lru_cache(maxsize=1)
+def _default_key_candidates() -> Tuple[str, ...]:
+    """Readable id_* private keys in ~/.ssh, in preference order.
+
+    One scandir discovers every id_* private key, including custom
+    names like id_ed25519_work, instead of probing a hardcoded list.
+    A missing ~/.ssh costs a single failed syscall, and the lru_cache
+    memoizes the empty result, so keyless environments (CI containers)
+    pay it at most once.
+    """
+    try:
+        names = [
+            entry.name
+            for entry in os.scandir(_HOME_SSH)
+            if entry.is_file(follow_symlinks=False)
+            and entry.name.startswith("id_")
+            and not entry.name.endswith(".pub")
+        ]
+    except FileNotFoundError:
+        return ()
+
+    readable = []
+    for name in sorted(names, key=_key_preference):
+        candidate = os.path.join(_HOME_SSH, name)
+        # access(R_OK) costs the same syscall as an exists() probe but
+        # also skips keys we could never open, so a chmod 000 id_rsa
+        # falls through to the next usable key instead of a confusing
+        # auth failure later.
+        if os.access(candidate, os.R_OK):
+            readable.append(candidate)
+
+    return tuple(readable)
+
+
+@lru_cache(maxsize=256)
+def resolve_key_for(
+    user: str, host: str, explicit: Optional[str] = None
+) -> Optional[str]:
+    """Resolve the SSH key to use for a (user, host) pair, memoized.
+
+    Parallel tasks against the same host share one cached resolution
+    instead of re-probing the key per task. user and host are cache
+    discriminators only for now; per-host overrides can hook in here
+    later without touching the callers.
+    """
+    return get_ssh_key_path(explicit)
+
+
+def get_all_ssh_key_paths() -> List[str]:
+    """Return every usable default SSH key, best candidate first.
+
+    Offering the full list to the SSH client lets it try each key
+    within a single authenticated handshake, instead of one full
+    TCP+kex round-trip per wrong key.
+    """
+    return list(_default_key_candidates())
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that memoizes the formatted timestamp per second.
+
+    %(asctime)s calls time.strftime on every record; on verbose runs
+    with thousands of task log lines that adds up. Records within the
+    same second reuse the cached string, with only the cheap millisecond
+    suffix recomputed per record.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._cached_second: Optional[int] = None
+        self._cached_time = ""
+
+    def formatTime(self, record, datefmt=None) -> str:
+        current_second = int(record.created)
+        if current_second != self._cached_second:
+            self._cached_time = time.strftime(
+                datefmt or self.default_time_format,
+                time.localtime(current_second),
+            )
+            self._cached_second = current_second
+
+        if datefmt:
+            return self._cached_time
+        return self.default_msec_format % (self._cached_time, record.msecs)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -102,7 +242,7 @@ def get_logger(name: str) -> logging.Logger:
 
     handler = logging.StreamHandler()
     # ✅ CORRECTION : Sans datefmt %f (Windows incompatible)
-    formatter = logging.Formatter(
+    formatter = CachedTimeFormatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
     handler.setFormatter(formatter)
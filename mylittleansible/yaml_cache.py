@@ -0,0 +1,70 @@
+"""Disk cache for parsed YAML files."""
+
+import hashlib
+import logging
+import os
+import pickle
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+logger = logging.getLogger("mla")
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "mla")
+
+
+def load_cached(file_path: str) -> Any:
+    """
+    Load a YAML file, reusing a pickled copy when the source is unchanged.
+
+    The parsed object is pickled under ~/.cache/mla keyed by the file's
+    absolute path, together with the source's (mtime_ns, size). When the
+    stored header still matches, unpickling replaces the YAML parse,
+    which is orders of magnitude faster on repeated runs. Cache failures
+    are never fatal: any problem falls back to a normal parse.
+
+    Args:
+        file_path: Path to the YAML file
+
+    Returns:
+        The parsed YAML document
+
+    Raises:
+        FileNotFoundError: If the source file doesn't exist
+        yaml.YAMLError: If the source YAML is invalid
+    """
+    abspath = os.path.abspath(file_path)
+    stat = os.stat(abspath)
+    header = (stat.st_mtime_ns, stat.st_size)
+
+    digest = hashlib.sha1(abspath.encode("utf-8")).hexdigest()
+    cache_file = os.path.join(CACHE_DIR, f"{digest}.pkl")
+
+    try:
+        with open(cache_file, "rb") as f:
+            cached_header, data = pickle.load(f)
+        if cached_header == header:
+            logger.debug("YAML cache hit for %s", abspath)
+            return data
+    except (OSError, pickle.PickleError, EOFError, ValueError):
+        pass
+
+    # Binary mode: the loader decodes UTF-8 itself (in C when libyaml is
+    # available), which skips TextIOWrapper's separate decode pass.
+    with open(abspath, "rb") as f:
+        data = yaml.load(f, Loader=SafeLoader)
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_file, "wb") as f:
+            pickle.dump((header, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        logger.debug("Could not write YAML cache for %s", abspath)
+
+    return data
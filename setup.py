@@ -1,14 +1,15 @@
-﻿from setuptools import setup, find_packages
+﻿from setuptools import setup
 
 setup(
     name="mylittleansible",
     version="0.1.0",
-    packages=find_packages(),
+    packages=["mylittleansible", "mylittleansible.modules"],
     install_requires=[
-        "paramiko==3.4.0",
-        "jinja2==3.1.2",
-        "click==8.1.7",
-        "pyyaml==6.0.1",
+        "paramiko>=3.4,<4",
+        "jinja2>=3.1,<4",
+        "click>=8.1,<9",
+        "pyyaml>=6.0,<7",
+        "asyncssh>=2.14,<3",
     ],
     entry_points={
         "console_scripts": [
@@ -0,0 +1,174 @@
+"""Unit tests for Playbook validation and task preparation."""
+
+import subprocess
+
+import pytest
+from mylittleansible.inventory import Inventory
+from mylittleansible.playbook import Playbook, PlaybookError
+from mylittleansible.utils import CmdResult
+
+
+class FakeShellManager:
+    """Stand-in for SSHManager that runs 'remote' scripts in a local shell."""
+
+    def run_command(self, script):
+        proc = subprocess.run(
+            ["/bin/sh", "-c", script], capture_output=True, text=True
+        )
+        return CmdResult(
+            stdout=proc.stdout, stderr=proc.stderr, exit_code=proc.returncode
+        )
+
+
+def make_inventory(hosts):
+    return Inventory(inventory_file="inventory.yml", hosts=hosts)
+
+
+class TestValidate:
+    """Test Playbook.validate."""
+
+    def test_validate_ok(self):
+        """Valid tasks and hosts pass without raising."""
+        playbook = Playbook([{"module": "command", "params": {"cmd": "ls"}}])
+        inventory = make_inventory({"web01": {"ssh_address": "10.0.0.1"}})
+        playbook.validate(inventory)
+
+    def test_validate_unknown_module(self):
+        """Unknown modules are rejected before any SSH work."""
+        playbook = Playbook([{"module": "does_not_exist"}])
+        inventory = make_inventory({"web01": {"ssh_address": "10.0.0.1"}})
+        with pytest.raises(PlaybookError, match="unknown module"):
+            playbook.validate(inventory)
+
+    def test_validate_async_unsupported_module(self):
+        """SFTP-based modules are rejected upfront on the asyncssh backend."""
+        playbook = Playbook([{"module": "copy", "params": {"src": "a", "dest": "b"}}])
+        inventory = make_inventory({"web01": {"ssh_address": "10.0.0.1"}})
+        playbook.validate(inventory)
+        with pytest.raises(PlaybookError, match="asyncssh backend"):
+            playbook.validate(inventory, backend="asyncssh")
+
+    def test_validate_missing_ssh_address(self):
+        """Hosts without an ssh_address are rejected."""
+        playbook = Playbook([{"module": "command", "params": {"cmd": "ls"}}])
+        inventory = make_inventory({"web01": {"ssh_port": 22}})
+        with pytest.raises(PlaybookError, match="ssh_address"):
+            playbook.validate(inventory)
+
+
+class TestResolveModules:
+    """Test Playbook._resolve_modules."""
+
+    def test_resolve_annotates_tasks(self):
+        """Runnable tasks get their class and label attached."""
+        playbook = Playbook([{"module": "command", "params": {"cmd": "ls"}}])
+        runnable, skipped = playbook._resolve_modules()
+        assert len(runnable) == 1
+        assert skipped == []
+        task_idx, task = runnable[0]
+        assert task_idx == 1
+        assert task["_label"] == "command (Task 1)"
+        assert task["_cls"].name == "command"
+
+    def test_resolve_skips_unknown(self):
+        """Tasks with missing or unknown modules are excluded but reported."""
+        playbook = Playbook(
+            [
+                {"module": "command", "params": {"cmd": "ls"}},
+                {"module": "does_not_exist"},
+                {"params": {}},
+            ]
+        )
+        runnable, skipped = playbook._resolve_modules()
+        assert [idx for idx, _ in runnable] == [1]
+        assert [idx for idx, _, _ in skipped] == [2, 3]
+
+    def test_skipped_results_counted_per_host(self):
+        """Each skipped task yields one SKIPPED result per host."""
+        playbook = Playbook([{"params": {}}])
+        inventory = make_inventory(
+            {
+                "web01": {"ssh_address": "10.0.0.1"},
+                "web02": {"ssh_address": "10.0.0.2"},
+            }
+        )
+        _, skipped = playbook._resolve_modules()
+        results = playbook._skipped_results(inventory, skipped)
+        assert len(results) == 2
+        assert all(r.status == "SKIPPED" for r in results)
+
+
+class TestCoalesce:
+    """Test Playbook._coalesce."""
+
+    def test_coalesce_groups_shell_tasks(self):
+        """Consecutive shell-renderable tasks form one group."""
+        playbook = Playbook(
+            [
+                {"module": "command", "params": {"cmd": "ls"}},
+                {"module": "sysctl", "params": {"name": "k", "value": 1}},
+                {"module": "copy", "params": {"src": "a", "dest": "b"}},
+                {"module": "service", "params": {"name": "x", "state": "started"}},
+            ]
+        )
+        runnable, _ = playbook._resolve_modules()
+        groups = playbook._coalesce(runnable)
+        assert [len(g) for g in groups] == [2, 1, 1]
+
+    def test_coalesce_dry_run_never_batches(self):
+        """Dry-run keeps every task in its own group."""
+        playbook = Playbook(
+            [
+                {"module": "command", "params": {"cmd": "ls"}},
+                {"module": "command", "params": {"cmd": "pwd"}},
+            ],
+            dry_run=True,
+        )
+        runnable, _ = playbook._resolve_modules()
+        groups = playbook._coalesce(runnable)
+        assert [len(g) for g in groups] == [1, 1]
+
+
+class TestDryRun:
+    """Test that dry runs stay entirely local."""
+
+    def test_dry_run_executes_without_connecting(self):
+        """A dry run completes against an unreachable host."""
+        playbook = Playbook(
+            [{"module": "command", "params": {"cmd": "ls"}}], dry_run=True
+        )
+        inventory = make_inventory({"web01": {"ssh_address": "203.0.113.1"}})
+        result = playbook.execute(inventory)
+        assert result.is_success
+        assert result.ok_count == 1
+
+
+class TestExecuteBatch:
+    """Test Playbook._execute_batch against a real shell."""
+
+    def _run_batch(self, commands):
+        playbook = Playbook(
+            [{"module": "command", "params": {"cmd": cmd}} for cmd in commands]
+        )
+        runnable, _ = playbook._resolve_modules()
+        (group,) = playbook._coalesce(runnable)
+        return playbook._execute_batch("web01", group, FakeShellManager())
+
+    def test_batch_tolerates_comments_and_semicolons(self):
+        """Commands with trailing comments or semicolons stay valid."""
+        results = self._run_batch(["echo hello # greet", "echo world;"])
+        assert [r.status for r in results] == ["OK", "OK"]
+
+    def test_batch_stops_after_failure(self):
+        """A failing step reports FAILED and skips the remaining steps."""
+        results = self._run_batch(["false", "echo never"])
+        assert [r.status for r in results] == ["FAILED"]
+
+    def test_batch_keeps_per_step_output(self):
+        """Each step's stdout lands in its own result message."""
+        results = self._run_batch(["echo hello", "echo world"])
+        assert [r.message for r in results] == ["hello", "world"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
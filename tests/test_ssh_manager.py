@@ -0,0 +1,53 @@
+"""Unit tests for SSHManager connection caching."""
+
+import pytest
+from mylittleansible.ssh_manager import SSHManager
+
+
+class FakeTransport:
+    """Stand-in for paramiko.Transport with a controllable liveness."""
+
+    def __init__(self, active=True):
+        self.active = active
+
+    def is_active(self):
+        return self.active
+
+
+class FakeClient:
+    """Stand-in for paramiko.SSHClient."""
+
+    def __init__(self, active=True):
+        self.transport = FakeTransport(active)
+        self.closed = False
+
+    def get_transport(self):
+        return self.transport
+
+    def close(self):
+        self.closed = True
+
+
+class TestConnectionCache:
+    """Test the cached-connection fast path in SSHManager.connect."""
+
+    def test_connect_reuses_active_client(self):
+        """An active cached client is returned without any network I/O."""
+        manager = SSHManager(hostname="host")
+        fake = FakeClient(active=True)
+        manager.client = fake
+        assert manager.connect() is fake
+        assert fake.closed is False
+
+    def test_close_clears_client(self):
+        """close() tears down and forgets the cached client."""
+        manager = SSHManager(hostname="host")
+        fake = FakeClient()
+        manager.client = fake
+        manager.close()
+        assert fake.closed is True
+        assert manager.client is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,6 +1,7 @@
 """Unit tests for MyLittleAnsible modules."""
 
 import pytest
+from mylittleansible import utils
 from mylittleansible.utils import CmdResult, TaskResult, PlaybookResult
 
 
@@ -92,5 +93,62 @@ class TestPlaybookResult:
         assert result.is_success is False
 
 
+class TestDefaultKeyDiscovery:
+    """Test the scandir-based default SSH key discovery."""
+
+    @pytest.fixture(autouse=True)
+    def fake_ssh_dir(self, tmp_path, monkeypatch):
+        """Point _HOME_SSH at a tmp dir and reset the discovery caches."""
+        monkeypatch.setattr(utils, "_HOME_SSH", str(tmp_path))
+        utils._default_key_candidates.cache_clear()
+        utils.get_ssh_key_path.cache_clear()
+        utils.resolve_key_for.cache_clear()
+        yield tmp_path
+        utils._default_key_candidates.cache_clear()
+        utils.get_ssh_key_path.cache_clear()
+        utils.resolve_key_for.cache_clear()
+
+    def test_discovers_id_keys_only(self, fake_ssh_dir):
+        """Only id_* private keys are candidates, public halves excluded."""
+        (fake_ssh_dir / "id_rsa").write_text("key")
+        (fake_ssh_dir / "id_rsa.pub").write_text("pub")
+        (fake_ssh_dir / "known_hosts").write_text("...")
+        assert utils.get_all_ssh_key_paths() == [str(fake_ssh_dir / "id_rsa")]
+
+    def test_prefers_modern_key_types(self, fake_ssh_dir):
+        """ed25519 beats rsa, exact names beat variants, unknown ranks last."""
+        for name in ("id_rsa", "id_ed25519", "id_ed25519_work", "id_custom"):
+            (fake_ssh_dir / name).write_text("key")
+        assert utils.get_all_ssh_key_paths() == [
+            str(fake_ssh_dir / "id_ed25519"),
+            str(fake_ssh_dir / "id_ed25519_work"),
+            str(fake_ssh_dir / "id_rsa"),
+            str(fake_ssh_dir / "id_custom"),
+        ]
+        assert utils.get_ssh_key_path() == str(fake_ssh_dir / "id_ed25519")
+
+    def test_skips_unreadable_keys(self, fake_ssh_dir, monkeypatch):
+        """An unreadable key falls through to the next candidate."""
+        (fake_ssh_dir / "id_ed25519").write_text("key")
+        (fake_ssh_dir / "id_rsa").write_text("key")
+        unreadable = str(fake_ssh_dir / "id_ed25519")
+        # os.access reports everything readable for root, so fake the
+        # permission check instead of chmod.
+        monkeypatch.setattr(
+            utils.os,
+            "access",
+            lambda path, mode: path != unreadable,
+        )
+        assert utils.get_all_ssh_key_paths() == [str(fake_ssh_dir / "id_rsa")]
+
+    def test_missing_ssh_dir(self, fake_ssh_dir, monkeypatch):
+        """A missing ~/.ssh yields no candidates and no error."""
+        monkeypatch.setattr(
+            utils, "_HOME_SSH", str(fake_ssh_dir / "does_not_exist")
+        )
+        assert utils.get_all_ssh_key_paths() == []
+        assert utils.get_ssh_key_path() is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])